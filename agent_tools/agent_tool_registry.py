@@ -9,6 +9,8 @@ class AgentToolRegistry(Singleton):
         """Initialize AgentToolRegistry instance"""
         # Create and manage the global ToolRegistry
         self.registry = ToolRegistry()
+        # api_format -> tools schema, rebuilt only after register()
+        self._tools_json_cache = {}
 
     # Proxy methods to underlying ToolRegistry
     def get_available_tools(self):
@@ -16,8 +18,10 @@ class AgentToolRegistry(Singleton):
         return self.registry.get_available_tools()
 
     def get_tools_json(self, api_format="openai-chatcompletion"):
-        """Get tools schema in JSON format"""
-        return self.registry.get_tools_json(api_format=api_format)
+        """Get tools schema in JSON format (cached until the next register)"""
+        if api_format not in self._tools_json_cache:
+            self._tools_json_cache[api_format] = self.registry.get_tools_json(api_format=api_format)
+        return self._tools_json_cache[api_format]
 
     def execute_tool_calls(self, tool_calls):
         """Execute tool calls"""
@@ -25,6 +29,7 @@ class AgentToolRegistry(Singleton):
 
     def register(self, func):
         """Register a new tool function"""
+        self._tools_json_cache.clear()
         return self.registry.register(func)
 
     def get_tool(self, tool_name):
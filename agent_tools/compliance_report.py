@@ -121,7 +121,7 @@ class ComplianceReport:
             {regulation_text}
 
             TOOL EXECUTION RESULTS:
-            {json.dumps(tool_results, indent=2)}
+            {json.dumps(tool_results, separators=(",", ":"))}
             
             LAST ACTION:
             {last_action_text}
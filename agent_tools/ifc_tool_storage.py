@@ -82,8 +82,9 @@ class ToolStorage:
             span.set_attribute("store_ifc_tool.category", category)
             span.set_attribute("store_ifc_tool.description", description)
 
-            # Store the tool with complete metadata
-            success = self.store_tool(ifc_tool_name, code, description, category, metadata)
+            # Store the tool with complete metadata (one timestamp shared by all records)
+            stored_at = datetime.now().isoformat()
+            success = self.store_tool(ifc_tool_name, code, description, category, metadata, created_at=stored_at)
 
             if success:
                 result_data = {
@@ -91,7 +92,7 @@ class ToolStorage:
                     "ifc_tool_name": ifc_tool_name,
                     "category": category,
                     "file_path": self._get_tool_file_path(category, ifc_tool_name),
-                    "stored_at": datetime.now().isoformat(),
+                    "stored_at": stored_at,
                     "vector_db_indexed": ToolVectorManager.get_instance().is_available(),
                     "description": description
                 }
@@ -129,12 +130,14 @@ class ToolStorage:
 
 
     def store_tool(self, ifc_tool_name: str, code: str, description: str,
-                   category: str, metadata: ToolMetadata) -> bool:
+                   category: str, metadata: ToolMetadata, created_at: Optional[str] = None) -> bool:
         """Store tool with coordinated filesystem, vector DB and metadata management"""
 
         try:
+            created_at = created_at or datetime.now().isoformat()
+
             # Step 1: Save to filesystem using persistent storage with complete metadata
-            filesystem_success = self._save_to_filesystem(ifc_tool_name, code, description, category, metadata)
+            filesystem_success = self._save_to_filesystem(ifc_tool_name, code, description, category, metadata, created_at)
 
             if not filesystem_success:
                 print(f"Failed to save {ifc_tool_name} to filesystem")
@@ -144,7 +147,7 @@ class ToolStorage:
             vector_success = True
             vector_db = ToolVectorManager.get_instance()
             if vector_db.is_available():
-                vector_success = self._add_to_vector_db(ifc_tool_name, metadata)
+                vector_success = self._add_to_vector_db(ifc_tool_name, metadata, created_at)
                 if not vector_success:
                     print(f"Warning: Failed to add {ifc_tool_name} to vector database")
         
@@ -157,7 +160,7 @@ class ToolStorage:
             return False
 
 
-    def _save_to_filesystem(self, ifc_tool_name: str, code: str, description: str, category: str, metadata: ToolMetadata) -> bool:
+    def _save_to_filesystem(self, ifc_tool_name: str, code: str, description: str, category: str, metadata: ToolMetadata, created_at: str) -> bool:
         """Save tool to categorized filesystem storage with complete metadata"""
         try:
             # Ensure base directory exists (lazy creation)
@@ -177,7 +180,7 @@ class ToolStorage:
             complete_metadata = {
                 **metadata.model_dump(),
                 'file_path': str(tool_file),
-                'created_at': datetime.now().isoformat(),
+                'created_at': created_at,
                 'creation_source': 'agent'  # Mark as agent-generated
             }
 
@@ -202,7 +205,7 @@ class ToolStorage:
             return False
     
     
-    def _add_to_vector_db(self, ifc_tool_name: str, metadata: ToolMetadata) -> bool:
+    def _add_to_vector_db(self, ifc_tool_name: str, metadata: ToolMetadata, created_at: str) -> bool:
         """Add tool to vector database for semantic search"""
         try:
             # Prepare metadata for vector DB storage with creation source
@@ -210,7 +213,7 @@ class ToolStorage:
             tool_metadata = {
                 **metadata.model_dump(),
                 'creation_source': 'agent',  # Mark as agent-generated
-                'created_at': datetime.now().isoformat()
+                'created_at': created_at
             }
 
             # Use vector database's add_tool method
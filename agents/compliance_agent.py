@@ -80,6 +80,8 @@ class ComplianceAgent:
         session_id = str(uuid.uuid4())[:8]
         print(f"\nComplianceAgent: Session {session_id} initialized")
         self.shared_context.initialize_session(session_id, regulation_text, ifc_file_path)
+        # Cached LLM responses must not leak between compliance checks
+        LLMClient.clear_cache()
 
         # 2. Run ReAct loop (state managed in SharedContext)
         print(f"\nStarting ReAct loop (max {max_iterations} iterations)...")
@@ -94,10 +96,11 @@ class ComplianceAgent:
 
         # 3. Handle timeout
         print(f"\n[WARNING] Exceeded maximum iterations ({max_iterations})")
-        return AgentResult(
+        # AgentResult is built from already-validated internal state, so skip re-validation
+        return AgentResult.model_construct(
             status="timeout",
             iterations_used=max_iterations,
-            agent_history=self.shared_context.agent_history,
+            agent_history=list(self.shared_context.agent_history),
             error=f"Exceeded maximum iterations ({max_iterations})"
         )
 
@@ -123,7 +126,7 @@ class ComplianceAgent:
                 "action": "auto_generate_report",
                 "action_input": None
             }
-            self.shared_context.agent_history.append(iteration_entry)
+            self.shared_context.add_history_entry(iteration_entry)
 
             # Automatically trigger compliance report generation
             compliance_report = ComplianceReport()
@@ -131,18 +134,18 @@ class ComplianceAgent:
 
             if report_result.success:
                 print(f"[OK] Compliance report generated - {report_result.result.overall_status}")
-                return AgentResult(
+                return AgentResult.model_construct(
                     status="success",
                     iterations_used=iteration + 1,
-                    agent_history=self.shared_context.agent_history,
+                    agent_history=list(self.shared_context.agent_history),
                     compliance_result=report_result.result
                 )
             else:
                 print(f"[ERROR] Compliance report generation failed: {report_result.error}")
-                return AgentResult(
+                return AgentResult.model_construct(
                     status="failed",
                     iterations_used=iteration + 1,
-                    agent_history=self.shared_context.agent_history,
+                    agent_history=list(self.shared_context.agent_history),
                     error=f"Compliance report generation failed: {report_result.error}"
                 )
 
@@ -180,7 +183,7 @@ class ComplianceAgent:
             "action_input": action_input,
             "action_result": action_result.model_dump()
         }
-        self.shared_context.agent_history.append(iteration_entry)
+        self.shared_context.add_history_entry(iteration_entry)
 
         print(iteration_entry)
 
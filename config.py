@@ -34,6 +34,11 @@ class Config:
     PHOENIX_ENDPOINT = os.getenv("PHOENIX_ENDPOINT", "https://app.phoenix.arize.com/v1/traces")
     PHOENIX_PROJECT_NAME = os.getenv("PHOENIX_PROJECT_NAME", "ACC")
     PHOENIX_ENABLED = os.getenv("PHOENIX_ENABLED", "true").lower() == "true"
+    PHOENIX_VERBOSE_SPANS = os.getenv("PHOENIX_VERBOSE_SPANS", "false").lower() == "true"
+    # Batch span export tuning (buffer size, spans per export, export interval)
+    PHOENIX_MAX_QUEUE_SIZE = int(os.getenv("PHOENIX_MAX_QUEUE_SIZE", "2048"))
+    PHOENIX_MAX_EXPORT_BATCH_SIZE = int(os.getenv("PHOENIX_MAX_EXPORT_BATCH_SIZE", "512"))
+    PHOENIX_SCHEDULE_DELAY_MS = int(os.getenv("PHOENIX_SCHEDULE_DELAY_MS", "5000"))
     
     @classmethod
     def validate(cls):
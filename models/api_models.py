@@ -3,7 +3,7 @@ Pydantic models for API requests and responses
 """
 
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class ComplianceCheckRequest(BaseModel):
@@ -25,11 +25,11 @@ class CoordinationInfoModel(BaseModel):
     total_steps: int = Field(..., ge=0, description="Total number of steps")
     communication_summary: Dict[str, Any] = Field(default_factory=dict, description="Communication summary")
 
-    @field_validator('steps_completed')
-    def validate_steps_completed(cls, v, values):
-        if 'total_steps' in values and v > values['total_steps']:
+    @model_validator(mode='after')
+    def validate_steps_completed(self):
+        if self.steps_completed > self.total_steps:
             raise ValueError('Steps completed cannot exceed total steps')
-        return v
+        return self
 
 
 class ComplianceCheckResponse(BaseModel):
@@ -1,12 +1,14 @@
 
+import sys
 from typing import List, Dict, Any, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 # === Regulation Interpretation ===
 
 class TermClarification(BaseModel):
     """Clarification for a specific technical term in a regulation"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
     term: str = Field(..., description="The term to clarify")
     meaning: str = Field(..., description="What this term means in the regulation context")
@@ -16,6 +18,8 @@ class TermClarification(BaseModel):
 
 class RegulationInterpretation(BaseModel):
     """Human-readable interpretation of a regulation with disambiguated semantics"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     plain_language: str = Field(..., description="Simple explanation of the regulation in everyday language (2-3 sentences)")
     term_clarifications: List[TermClarification] = Field(default_factory=list, description="Clarifications for technical terms and concepts that may be ambiguous")
     common_misunderstandings: List[str] = Field(default_factory=list, description="Common mistakes or misinterpretations to avoid when implementing this check")
@@ -25,21 +29,33 @@ class RegulationInterpretation(BaseModel):
 
 class CheckedComponent(BaseModel):
     """Model for individual IFC component compliance check result"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     component_id: str = Field(..., description="IFC GUID or unique component identifier")
     component_type: str = Field(..., description="IFC class or category, e.g., IfcDoor, IfcWall")
     checked_rule: str = Field(..., description="The rule/check being applied")
     data_used: Dict[str, str] = Field(..., description="Key-value data used for compliance checking")
-    compliance_status: str = Field(..., description="one of: compliant, non_compliant, uncertain")
+    compliance_status: Literal["compliant", "non_compliant", "uncertain"] = Field(..., description="one of: compliant, non_compliant, uncertain")
     violation_reason: Optional[str] = Field(None, description="Reason for non-compliance if applicable")
     suggested_fix: Optional[str] = Field(None, description="Optional suggestion to fix non-compliance")
 
+    @field_validator('data_used', mode='before')
+    @classmethod
+    def _intern_data_keys(cls, v: Any) -> Any:
+        """Intern data_used keys, which repeat across components checked against the same rule"""
+        if isinstance(v, dict):
+            return {sys.intern(k) if isinstance(k, str) else k: val for k, val in v.items()}
+        return v
+
 
 class RelationshipCheck(BaseModel):
     """Model for relationship-based compliance checks between IFC components"""
-    relation_type: str = Field(..., description="Type of relationship being checked (e.g., geometry / topology / semantic)")
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    relation_type: Literal["geometry", "topology", "semantic"] = Field(..., description="Type of relationship being checked: geometry / topology / semantic")
     relation_name: str = Field(..., description="Name of the relationship being checked")
     involved_components: List[str] = Field(..., description="List of components involved in the relationship")
-    compliance_status: str = Field(..., description="Compliance status of the relationship")
+    compliance_status: Literal["compliant", "non_compliant", "uncertain"] = Field(..., description="Compliance status of the relationship")
     analysis_evidence: Optional[Dict[str, str]] = Field(None, description="Evidence supporting the compliance analysis")
     violation_reason: Optional[str] = Field(None, description="Reason for non-compliance if applicable")
     suggested_fix: Optional[str] = Field(None, description="Optional suggestion to fix non-compliance")
@@ -47,7 +63,7 @@ class RelationshipCheck(BaseModel):
 
 class ComplianceEvaluationModel(BaseModel):
     """Model for compliance evaluation results"""
-    overall_status: str = Field(..., description="Aggregate status: compliant / non_compliant / partial / uncertain / not_applicable")
+    overall_status: Literal["compliant", "non_compliant", "partial", "uncertain", "not_applicable"] = Field(..., description="Aggregate status: compliant / non_compliant / partial / uncertain / not_applicable")
     compliant_components: List[CheckedComponent] = Field(..., description="List of compliant components")
     non_compliant_components: List[CheckedComponent] = Field(..., description="List of non-compliant components")
     uncertain_components: List[CheckedComponent] = Field(..., description="List of components with uncertain compliance")
@@ -58,16 +74,20 @@ class ComplianceEvaluationModel(BaseModel):
 
 class AgentToolResult(BaseModel):
     """Standardized result model for agent tool execution"""
-    success: bool = Field(..., description="Whether the execution was successful")
-    agent_tool_name: str = Field(..., description="Name of the agent tool executed")
-    result: Optional[Any] = Field(None, description="Result data if successful")
-    error: Optional[str] = Field(None, description="Error message if failed")
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    success: bool
+    agent_tool_name: str
+    result: Optional[Any] = None  # Result data if successful
+    error: Optional[str] = None  # Error message if failed
 
 
 # === Tool Creation ===
 
 class ToolSpec(BaseModel):
     """Tool requirement specification"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     description: str = Field(..., description="Description of what the tool should do")
     function_name: str = Field(..., description="Name of the function to be created")
     parameters: List[Dict[str, Any]] = Field(..., description="List of function parameters")
@@ -77,6 +97,8 @@ class ToolSpec(BaseModel):
 
 class RetrievedDocument(BaseModel):
     """Retrieved document from RAG system"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     content: str = Field(..., description="Content of the retrieved document")
     metadata: Dict[str, Any] = Field(..., description="Document metadata")
     relevance_score: float = Field(..., description="Relevance score for the document")
@@ -84,6 +106,8 @@ class RetrievedDocument(BaseModel):
 
 class ToolParam(BaseModel):
     """Function parameter definition"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     name: str = Field(..., description="Parameter name")
     type: str = Field(..., description="Parameter type, e.g., 'str', 'int', 'float', 'dict'")
     description: Optional[str] = Field(None, description="Parameter description")
@@ -112,16 +136,18 @@ class ToolCreatorOutput(BaseModel):
 
 class IFCToolResult(BaseModel):
     """Result model for IFC tool execution (syntax and runtime)"""
-    success: bool = Field(..., description="Whether the code passed the check")
-    ifc_tool_name: str = Field(..., description="IFC tool name")
-    result: Optional[Any] = Field(None, description="Result of code execution if successful")
-    parameters_used: Dict[str, Any] = Field(default_factory=dict, description="Parameters used")
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    success: bool
+    ifc_tool_name: str
+    result: Optional[Any] = None  # Result of code execution if successful
+    parameters_used: Dict[str, Any] = Field(default_factory=dict)
 
     # Error-related fields (only present when success=False)
-    error_message: Optional[str] = Field(None, description="Error message")
-    exception_type: Optional[str] = Field(None, description="Exception type, e.g., SyntaxError, RuntimeError")
-    traceback: Optional[str] = Field(None, description="Complete stack trace")
-    line_number: Optional[int] = Field(None, description="Line number where the error occurred")
+    error_message: Optional[str] = None
+    exception_type: Optional[str] = None  # e.g., SyntaxError, RuntimeError
+    traceback: Optional[str] = None
+    line_number: Optional[int] = None
 
 
 class FixedCodeOutput(BaseModel):
@@ -133,15 +159,19 @@ class FixedCodeOutput(BaseModel):
 
 class TestResult(BaseModel):
     """Test execution result"""
-    success: bool = Field(..., description="Whether the test was successful")
-    output: str = Field(..., description="Test output message")
-    error: str = Field(..., description="Error message if test failed")
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    success: bool
+    output: str
+    error: str
 
 
 # === ComplianceAgent ===
 
 class SubgoalModel(BaseModel):
     """Subgoal model - replaces StepModel"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: int = Field(..., description="Subgoal ID")
     description: str = Field(..., min_length=1, description="Goal description (WHAT to achieve, not HOW)")
     status: Literal["pending", "in_progress", "completed"] = Field(default="pending", description="Subgoal status")
@@ -152,6 +182,8 @@ class SubgoalSetModel(BaseModel):
     """Subgoal collection - replaces PlanModel
     Note: subgoals can be empty initially in ReAct architecture, as the agent may generate them dynamically during execution.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     subgoals: List[SubgoalModel] = Field(default_factory=list, description="List of subgoals (can be empty initially)")
     regulation_summary: str = Field(default="", description="Brief summary of the regulation")
 
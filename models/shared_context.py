@@ -1,10 +1,66 @@
 
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-from pydantic import BaseModel, Field
+import time
+import functools
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
 from utils.base_classes import Singleton
 from models.common_models import AgentToolResult, IFCToolResult, ComplianceEvaluationModel
 
+
+# Agent tool actions shown in the planning history
+_PLANNING_ACTIONS = frozenset({
+    'search_and_summarize',
+    'generate_interpretation',
+    'generate_subgoals',
+    'review_and_update_subgoals'
+})
+
+# Agent tool actions whose successful result is a ToolCreatorOutput
+_FIX_CREATE = frozenset({'create_ifc_tool', 'fix_ifc_tool'})
+
+# Maximum number of memoized formatter outputs kept by SharedContext
+_FORMAT_CACHE_SIZE = 32
+
+# Maximum number of search summaries kept in full; older ones are folded into one line
+_MAX_SEARCH_SUMMARIES = 50
+
+# Maximum characters of a single action input rendered into the complete history
+_MAX_INPUT_CHARS = 2000
+
+
+def _truncate(obj: Any, limit: int = _MAX_INPUT_CHARS) -> str:
+    """Stringify obj, capping the output at limit characters with an explicit marker"""
+    text = str(obj)
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}... [truncated {len(text) - limit} chars]"
+
+
+def _cached_format(method):
+    """Memoize a SharedContext formatter until the next history/search mutation"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (self._version, method.__name__, args, tuple(sorted(kwargs.items())))
+        cache = self._format_cache
+        if key in cache:
+            return cache[key]
+        output = method(self, *args, **kwargs)
+        if len(cache) >= _FORMAT_CACHE_SIZE:
+            del cache[next(iter(cache))]  # FIFO eviction
+        cache[key] = output
+        return output
+    return wrapper
+
+
+@dataclass(slots=True)
+class SearchSummary:
+    """Single web search summary record stored in SharedContext"""
+    query: str
+    summary: str
+    timestamp: float  # epoch seconds; format with datetime.fromtimestamp() when needed
+
+
 class SharedContext(Singleton, BaseModel):
     """Singleton shared context for multi-agent collaboration (ReAct architecture)"""
 
@@ -26,7 +82,7 @@ class SharedContext(Singleton, BaseModel):
     )
 
     # Web search summaries (supports multiple searches without overwriting)
-    search_summaries: List[Dict[str, Any]] = Field(
+    search_summaries: List[SearchSummary] = Field(
         default_factory=list,
         description="List of web search summaries with query, result, and timestamp"
     )
@@ -37,11 +93,27 @@ class SharedContext(Singleton, BaseModel):
         description="Final compliance evaluation result from Checker"
     )
 
+    # Lookup indices over agent_history (maintained by add_history_entry)
+    _entries_by_subgoal: Dict[Any, List[Dict[str, Any]]] = PrivateAttr(default_factory=dict)
+    _tools_by_name: Dict[str, Dict[str, Any]] = PrivateAttr(default_factory=dict)
+    _successful_ifc_executions: List[Dict[str, Any]] = PrivateAttr(default_factory=list)
+    _evidence_by_subgoal: Dict[Any, List[Dict[str, Any]]] = PrivateAttr(default_factory=dict)
+    _latest_failure_by_tool: Dict[str, Any] = PrivateAttr(default_factory=dict)  # "" holds the latest failure of any tool
+    _planning_entries: List[Dict[str, Any]] = PrivateAttr(default_factory=list)
+    _rendered_entries: List[str] = PrivateAttr(default_factory=list)  # per-entry format_complete_history blocks
+    _last_non_autoreport_entry: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    # Queries of search summaries evicted from search_summaries
+    _older_search_queries: List[str] = PrivateAttr(default_factory=list)
+
+    # Formatter output cache, keyed by a version bumped on every mutation
+    _version: int = PrivateAttr(default=0)
+    _format_cache: Dict[Tuple, str] = PrivateAttr(default_factory=dict)
+
 
     def _initialize(self):
         """Initialize SharedContext singleton instance"""
-        # Initialize Pydantic BaseModel with default values
-        super(BaseModel, self).__init__()
+        # Singleton.__init__ already guards re-entry, so Pydantic state is built exactly once here
         BaseModel.__init__(self)
         print("SharedContext: Singleton instance initialized")
 
@@ -57,6 +129,56 @@ class SharedContext(Singleton, BaseModel):
         self.agent_history = []
         self.search_summaries = []
         self.compliance_result = None
+        self._entries_by_subgoal = {}
+        self._tools_by_name = {}
+        self._successful_ifc_executions = []
+        self._evidence_by_subgoal = {}
+        self._latest_failure_by_tool = {}
+        self._planning_entries = []
+        self._rendered_entries = []
+        self._last_non_autoreport_entry = None
+        self._older_search_queries = []
+        self._version += 1
+
+    # === agent_history recording ===
+
+    def add_history_entry(self, entry: Dict[str, Any]) -> None:
+        """Append a ReAct iteration entry to agent_history and update lookup indices.
+
+        Args:
+            entry: Iteration entry with iteration, thought, action, action_input,
+                action_result and active_subgoal_id keys
+        """
+        self.agent_history.append(entry)
+        self._version += 1
+        self._entries_by_subgoal.setdefault(entry.get('active_subgoal_id'), []).append(entry)
+        self._rendered_entries.append(self._render_entry(entry))
+
+        action = entry.get('action')
+        action_result = entry.get('action_result') or {}
+        success = action_result.get('success')
+        result = action_result.get('result')
+
+        if action != 'auto_generate_report':
+            self._last_non_autoreport_entry = entry
+
+        if action in _PLANNING_ACTIONS:
+            self._planning_entries.append(entry)
+
+        if action == 'execute_ifc_tool':
+            if success:
+                self._successful_ifc_executions.append(entry)
+                self._evidence_by_subgoal.setdefault(entry.get('active_subgoal_id', 'unassigned'), []).append(entry)
+            else:
+                # Newer failures overwrite older ones, both overall and per tool
+                self._latest_failure_by_tool[""] = result
+                if isinstance(result, dict) and result.get('ifc_tool_name'):
+                    self._latest_failure_by_tool[result['ifc_tool_name']] = result
+
+        # Newer successful create/fix results overwrite older ones for the same tool
+        elif action in _FIX_CREATE and success:
+            if result and result.get('ifc_tool_name'):
+                self._tools_by_name[result['ifc_tool_name']] = result
 
     # === Web search summary methods ===
 
@@ -67,13 +189,14 @@ class SharedContext(Singleton, BaseModel):
             query: The search query used
             summary: The summarized search result (max ~500 chars)
         """
-        self.search_summaries.append({
-            "query": query,
-            "summary": summary,
-            "timestamp": datetime.now().isoformat()
-        })
-        print(f"SharedContext: Added search summary for query '{query}' (total: {len(self.search_summaries)})")
-
+        self.search_summaries.append(SearchSummary(query, summary, time.time()))
+        if len(self.search_summaries) > _MAX_SEARCH_SUMMARIES:
+            self._older_search_queries.append(self.search_summaries.pop(0).query)
+        self._version += 1
+        total = len(self._older_search_queries) + len(self.search_summaries)
+        print(f"SharedContext: Added search summary for query '{query}' (total: {total})")
+
+    @_cached_format
     def get_all_summaries(self) -> str:
         """Get all search summaries as formatted text for LLM consumption.
 
@@ -84,10 +207,14 @@ class SharedContext(Singleton, BaseModel):
             return ""
 
         formatted_summaries = []
-        for i, entry in enumerate(self.search_summaries, 1):
+        if self._older_search_queries:
             formatted_summaries.append(
-                f"Search {i}: {entry['query']}\n"
-                f"Result: {entry['summary']}"
+                f"Earlier searches (results omitted): {'; '.join(self._older_search_queries)}"
+            )
+        for i, entry in enumerate(self.search_summaries, len(self._older_search_queries) + 1):
+            formatted_summaries.append(
+                f"Search {i}: {entry.query}\n"
+                f"Result: {entry.summary}"
             )
 
         return "\n\n".join(formatted_summaries)
@@ -96,18 +223,11 @@ class SharedContext(Singleton, BaseModel):
 
     def get_successful_ifc_tool_executions(self) -> List[Dict[str, Any]]:
         """Get all successful IFC tool execution entries from agent_history."""
-        return [
-            entry for entry in self.agent_history
-            if (entry.get('action') == 'execute_ifc_tool' and
-                entry.get('action_result', {}).get('success'))
-        ]
+        return list(self._successful_ifc_executions)
 
     def get_entries_by_subgoal(self, subgoal_id: int) -> List[Dict[str, Any]]:
         """Get all agent_history entries related to a specific subgoal ID."""
-        return [
-            entry for entry in self.agent_history
-            if entry.get('active_subgoal_id') == subgoal_id
-        ]
+        return list(self._entries_by_subgoal.get(subgoal_id, ()))
 
     def get_tool_by_name(self, tool_name: str) -> Any:
         """Get the most recent successful tool creation or fix result by tool name.
@@ -118,20 +238,7 @@ class SharedContext(Singleton, BaseModel):
         Returns:
             ToolCreatorOutput object if found, None otherwise
         """
-        # Traverse agent_history in reverse (most recent first)
-        for entry in reversed(self.agent_history):
-            action = entry.get('action')
-            action_result = entry.get('action_result', {})
-
-            # Check if this is a successful create_ifc_tool or fix_ifc_tool action
-            if (action in ['create_ifc_tool', 'fix_ifc_tool'] and
-                action_result.get('success')):
-
-                result = action_result.get('result')
-                if result and result.get('ifc_tool_name') == tool_name:
-                    return result
-
-        return None
+        return self._tools_by_name.get(tool_name)
 
     def get_error_info_from_context(self, tool_name: str = "") -> Optional[IFCToolResult]:
         """Get error information from agent_history for failed IFC tool executions.
@@ -142,34 +249,17 @@ class SharedContext(Singleton, BaseModel):
         Returns:
             IFCToolResult with error information if found, None otherwise
         """
-        try:
-            # Traverse agent_history in reverse (most recent first)
-            for entry in reversed(self.agent_history):
-                action = entry.get('action')
-                action_result = entry.get('action_result', {})
-
-                # Check if this is a failed execute_ifc_tool action
-                if (action == 'execute_ifc_tool' and
-                    not action_result.get('success')):
-
-                    result = action_result.get('result', {})
-
-                    # Match tool name if specified
-                    if not tool_name or result.get('ifc_tool_name') == tool_name:
-                        return result
-
-            # No matching failure found
+        # Most recent failure for this tool, or for any tool when no name is given
+        result = self._latest_failure_by_tool.get(tool_name or "")
+        if result is None:
             msg = f"No failed execution found for tool '{tool_name}'" if tool_name \
                 else "No failed tool executions found"
             print(msg)
-            return None
-
-        except Exception as e:
-            print(f"Error getting error info from context: {e}")
-            return None
+        return result
 
     # === Formatting methods for LLM consumption ===
 
+    @_cached_format
     def format_successful_executions_summary(self, max_per_subgoal: int = 2) -> str:
         """Format successful IFC tool executions grouped by subgoal.
 
@@ -179,22 +269,12 @@ class SharedContext(Singleton, BaseModel):
         Returns:
             Formatted string suitable for LLM consumption
         """
-        successful_executions = self.get_successful_ifc_tool_executions()
-
-        if not successful_executions:
+        if not self._evidence_by_subgoal:
             return "## Data Collected: None yet"
 
-        # Group by subgoal
-        evidence_by_subgoal = {}
-        for entry in successful_executions:
-            subgoal_id = entry.get('active_subgoal_id', 'unassigned')
-            if subgoal_id not in evidence_by_subgoal:
-                evidence_by_subgoal[subgoal_id] = []
-            evidence_by_subgoal[subgoal_id].append(entry)
-
-        # Format output
+        # Successful executions are grouped by subgoal in add_history_entry
         lines = ["## Data Collected by Subgoal"]
-        for subgoal_id, entries in evidence_by_subgoal.items():
+        for subgoal_id, entries in self._evidence_by_subgoal.items():
             lines.append(f"\nSubgoal {subgoal_id}: {len(entries)} successful executions")
             for entry in entries[:max_per_subgoal]:
                 result = entry['action_result'].get('result', {})
@@ -207,6 +287,7 @@ class SharedContext(Singleton, BaseModel):
 
         return "\n".join(lines)
 
+    @_cached_format
     def format_subgoal_history(self, subgoal_id: int) -> str:
         """Format all history entries for a specific subgoal.
 
@@ -246,23 +327,14 @@ class SharedContext(Singleton, BaseModel):
 
         return "\n".join(lines)
 
+    @_cached_format
     def format_planning_history(self) -> str:
         """Format planning-related actions from agent_history.
 
         Returns:
             Formatted string with all planning actions
         """
-        planning_actions = [
-            'search_and_summarize',
-            'generate_interpretation',
-            'generate_subgoals',
-            'review_and_update_subgoals'
-        ]
-
-        planning_entries = [
-            entry for entry in self.agent_history
-            if entry.get('action') in planning_actions
-        ]
+        planning_entries = self._planning_entries
 
         if not planning_entries:
             return "## Planning History: No planning actions yet"
@@ -283,6 +355,7 @@ class SharedContext(Singleton, BaseModel):
 
         return "\n".join(lines)
 
+    @_cached_format
     def format_last_action(self) -> str:
         """Format the last action result from agent_history.
 
@@ -292,13 +365,8 @@ class SharedContext(Singleton, BaseModel):
         if not self.agent_history:
             return ""
 
-        # If last action is auto_generate_report, get the one before it
-        if len(self.agent_history) >= 2 and self.agent_history[-1].get('action') == 'auto_generate_report':
-            last_iteration = self.agent_history[-2]
-        elif len(self.agent_history) >= 1:
-            last_iteration = self.agent_history[-1]
-        else:
-            return ""
+        # Skip a trailing auto_generate_report in favour of the action before it
+        last_iteration = self._last_non_autoreport_entry or self.agent_history[-1]
 
         last_action_result = last_iteration.get('action_result', {})
 
@@ -313,65 +381,67 @@ class SharedContext(Singleton, BaseModel):
 
         return last_action_text
 
+    @_cached_format
     def format_complete_history(self) -> str:
-        """Format complete agent_history without filtering or truncation.
+        """Format complete agent_history without filtering or truncating results.
 
         Returns:
             Formatted string with all iteration history including full thoughts, actions, and results
+            (action inputs longer than _MAX_INPUT_CHARS are truncated)
         """
         if not self.agent_history:
             return "## Complete History: No actions yet"
 
-        lines = ["## Complete Agent History"]
-
-        for entry in self.agent_history:
-            iter_num = entry.get('iteration')
-            thought = entry.get('thought', '')
-            action = entry.get('action', '')
-            action_input = entry.get('action_input')
-            action_result = entry.get('action_result', {})
-            active_subgoal_id = entry.get('active_subgoal_id')
-
-            status_icon = "✓" if action_result.get('success') else "✗"
-
-            # Build iteration header
-            subgoal_info = f" [Subgoal {active_subgoal_id}]" if active_subgoal_id is not None else ""
-            lines.append(f"\n### Iteration {iter_num}{subgoal_info}")
-
-            # Add full thought if present
-            if thought:
-                lines.append(f"Thought: {thought}")
-
-            # Add action and status
-            lines.append(f"{status_icon} Action: {action}")
-
-            # Add full action input
-            if action_input:
-                lines.append(f"  Input: {str(action_input)}")
-
-            # Add full result
-            if action_result.get('success'):
-                result = action_result.get('result')
-                if isinstance(result, dict):
-                    if 'ifc_tool_name' in result:
-                        # This is an IFCToolResult - show both tool name and actual result data
-                        tool_name = result.get('ifc_tool_name')
-                        actual_result = result.get('result')  # The actual data returned by the tool
-                        lines.append(f"  Result: Tool '{tool_name}' executed successfully")
-                        if actual_result is not None:
-                            # Truncate very long results to keep context manageable
-                            result_str = str(actual_result)
-                            lines.append(f"  Data: {result_str}")
-                    elif 'subgoals' in result:
-                        # Subgoals result - reference the dedicated Subgoals section
-                        subgoals_list = result.get('subgoals', [])
-                        lines.append(f"  Result: Updated {len(subgoals_list)} subgoals (see Subgoals section above for current status)")
-                    else:
-                        lines.append(f"  Result: {str(result)}")
+        return "\n".join(["## Complete Agent History", *self._rendered_entries])
+
+    @staticmethod
+    def _render_entry(entry: Dict[str, Any]) -> str:
+        """Render a single agent_history entry for format_complete_history."""
+        iter_num = entry.get('iteration')
+        thought = entry.get('thought', '')
+        action = entry.get('action', '')
+        action_input = entry.get('action_input')
+        action_result = entry.get('action_result', {})
+        active_subgoal_id = entry.get('active_subgoal_id')
+
+        status_icon = "✓" if action_result.get('success') else "✗"
+
+        # Build iteration header
+        subgoal_info = f" [Subgoal {active_subgoal_id}]" if active_subgoal_id is not None else ""
+        lines = [f"\n### Iteration {iter_num}{subgoal_info}"]
+
+        # Add full thought if present
+        if thought:
+            lines.append(f"Thought: {thought}")
+
+        # Add action and status
+        lines.append(f"{status_icon} Action: {action}")
+
+        # Add action input, capped since the agent already knows what it sent
+        if action_input:
+            lines.append(f"  Input: {_truncate(action_input)}")
+
+        # Add full result
+        if action_result.get('success'):
+            result = action_result.get('result')
+            if isinstance(result, dict):
+                if 'ifc_tool_name' in result:
+                    # This is an IFCToolResult - show both tool name and actual result data
+                    tool_name = result.get('ifc_tool_name')
+                    actual_result = result.get('result')  # The actual data returned by the tool
+                    lines.append(f"  Result: Tool '{tool_name}' executed successfully")
+                    if actual_result is not None:
+                        lines.append(f"  Data: {str(actual_result)}")
+                elif 'subgoals' in result:
+                    # Subgoals result - reference the dedicated Subgoals section
+                    subgoals_list = result.get('subgoals', [])
+                    lines.append(f"  Result: Updated {len(subgoals_list)} subgoals (see Subgoals section above for current status)")
                 else:
                     lines.append(f"  Result: {str(result)}")
             else:
-                error = action_result.get('error', '')
-                lines.append(f"  Error: {error}")
+                lines.append(f"  Result: {str(result)}")
+        else:
+            error = action_result.get('error', '')
+            lines.append(f"  Error: {error}")
 
         return "\n".join(lines)
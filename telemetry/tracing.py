@@ -1,23 +1,49 @@
 
 import os
 import functools
+import threading
 from typing import Optional, Callable
-from phoenix.otel import register
-from openinference.instrumentation.openai import OpenAIInstrumentor
-from opentelemetry.trace import get_tracer_provider, Status, StatusCode
-from opentelemetry import trace
+from opentelemetry.trace import Status, StatusCode
 
 from config import Config
 
-# Global tracer instance
+# Global tracer instance and the provider it came from (set once by init_tracing)
 _tracer = None
+_tracer_provider = None
+_init_lock = threading.Lock()
+
+# Shared OK status; it carries no description, so one instance serves every span
+_STATUS_OK = Status(StatusCode.OK)
+
+# Attributes set on every successful span, built once
+_SUCCESS_ATTRIBUTES = {"function.success": True}
+
+# Emit attributes that duplicate the exception event (error.message)
+_verbose_spans = Config.PHOENIX_VERBOSE_SPANS
 
 
 def init_tracing() -> Optional[object]:
-    """Initialize Phoenix tracing if configured"""
-    global _tracer
+    """Initialize Phoenix tracing if configured (repeated calls return the existing provider)"""
+    # Registering and instrumenting twice would export every span twice
+    if _tracer_provider is not None:
+        return _tracer_provider
+
+    with _init_lock:
+        # Another thread may have finished initialization while this one waited
+        if _tracer_provider is not None:
+            return _tracer_provider
+        return _register_tracer_provider()
+
+
+def _register_tracer_provider() -> Optional[object]:
+    """Register the Phoenix tracer provider and instrumentors (caller holds _init_lock)"""
+    global _tracer, _tracer_provider
 
     try:
+        # Phoenix and OpenInference are only needed once tracing is enabled, so import them lazily
+        from phoenix.otel import register
+        from openinference.instrumentation.openai import OpenAIInstrumentor
+
         # Get configuration from Config class
         api_key = Config.PHOENIX_API_KEY
         endpoint = Config.PHOENIX_ENDPOINT
@@ -30,18 +56,28 @@ def init_tracing() -> Optional[object]:
         else:
             print("Warning: No API key provided - may not be able to connect to Phoenix cloud")
 
-        # Register Phoenix tracer provider
+        # Size the BatchSpanProcessor that register() attaches (read from OTEL_BSP_* at construction);
+        # explicit OTEL_BSP_* settings from the operator take precedence over Config defaults
+        os.environ.setdefault("OTEL_BSP_MAX_QUEUE_SIZE", str(Config.PHOENIX_MAX_QUEUE_SIZE))
+        os.environ.setdefault("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", str(Config.PHOENIX_MAX_EXPORT_BATCH_SIZE))
+        os.environ.setdefault("OTEL_BSP_SCHEDULE_DELAY", str(Config.PHOENIX_SCHEDULE_DELAY_MS))
+
+        # Register Phoenix tracer provider with batched, background span export
         tracer_provider = register(
             project_name=project_name,
             endpoint=endpoint,
-            auto_instrument=True  # Enable automatic instrumentation
+            batch=True,
+            auto_instrument=False  # Instrumentors are enabled explicitly below
         )
 
-        # Instrument OpenAI SDK for tracing
-        OpenAIInstrumentor().instrument(tracer_provider=tracer_provider)
+        # Instrument LLM SDKs for tracing (add e.g. LangChain/Anthropic here), skipping any already patched
+        for instrumentor in [OpenAIInstrumentor()]:
+            if not instrumentor.is_instrumented_by_opentelemetry:
+                instrumentor.instrument(tracer_provider=tracer_provider)
 
         # Initialize global tracer
         _tracer = tracer_provider.get_tracer("acc_system")
+        _tracer_provider = tracer_provider
 
         print(f"Phoenix tracing initialized successfully for project: {project_name}")
         return tracer_provider
@@ -55,38 +91,64 @@ def init_tracing() -> Optional[object]:
 def trace_method(span_name: Optional[str] = None):
     """Decorator to trace method execution with Phoenix"""
     def decorator(func: Callable) -> Callable:
+        # Tracing can never be initialized when Phoenix is disabled, so skip wrapping entirely
+        if not Config.PHOENIX_ENABLED:
+            return func
+
+        # Span name and basic attributes are fixed per function, so build them once
+        name = span_name or f"{func.__name__}"
+        base_attributes = {
+            "function.name": func.__name__,
+            "function.module": func.__module__,
+        }
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            # _tracer is set by init_tracing after decoration, so it is read once per call
+            tracer = _tracer
+
             # If tracing is not initialized, execute the original function directly
-            if not _tracer:
+            if not tracer:
                 return func(*args, **kwargs)
 
-            # Generate span name
-            name = span_name or f"{func.__name__}"
+            # Create tracing span; errors are recorded once by _record_span_error, not by the context manager
+            with tracer.start_as_current_span(
+                name,
+                attributes=base_attributes,
+                record_exception=False,
+                set_status_on_exception=False
+            ) as span:
+                # Sampled-out spans drop everything, so skip status/attribute bookkeeping
+                if not span.is_recording():
+                    return func(*args, **kwargs)
 
-            # Create tracing span
-            with _tracer.start_as_current_span(name) as span:
                 try:
-                    # Add basic attributes
-                    span.set_attribute("function.name", func.__name__)
-                    span.set_attribute("function.module", func.__module__)
-
                     # Execute original function
                     result = func(*args, **kwargs)
 
                     # Set span status to OK
-                    span.set_status(Status(StatusCode.OK))
-                    span.set_attribute("function.success", True)
+                    span.set_status(_STATUS_OK)
+                    span.set_attributes(_SUCCESS_ATTRIBUTES)
                     return result
 
                 except Exception as e:
-                    # Set span status to ERROR
-                    span.set_status(Status(StatusCode.ERROR, str(e)))
-                    span.set_attribute("function.success", False)
-                    span.set_attribute("error.type", type(e).__name__)
-                    span.set_attribute("error.message", str(e))
-                    span.record_exception(e)
+                    _record_span_error(span, e)
                     raise
 
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+def _record_span_error(span, e: Exception) -> None:
+    """Mark span as failed with the exception's type (and message in verbose mode)"""
+    message = str(e)
+    span.set_status(Status(StatusCode.ERROR, message))
+    error_attributes = {
+        "function.success": False,
+        "error.type": e.__class__.__name__,
+    }
+    if _verbose_spans:
+        error_attributes["error.message"] = message
+    span.set_attributes(error_attributes)
+    # The exception event already carries the message and stack trace
+    span.record_exception(e)
@@ -1,17 +1,11 @@
 from agent_tools.web_search import WebSearch
 from utils.llm_client import LLMClient
 
-from utils.ifc_parser import IFCParser
-
 #llm = LLMClient()
 #response = llm.generate_response("Hello, how are you?")
 #print(response)  
 
-regulation_text = open("test_regulation/1.txt", "r", encoding="utf-8").read()
-
 ifcfile_path = "test_ifc/AC20.ifc"
-ifc_parser = IFCParser()
-ifc_file = ifc_parser.load_file(ifcfile_path)
 
 # doors = ifc_parser.get_elements_by_type("IfcDoor")
 # print(doors)
@@ -73,7 +67,15 @@ from agent_tools.ifc_tool_execution import ToolExecution
 # stair_result = measure_stair_clear_width(ifcfile_path, "38a9vdh9bF5Qg28GWyHhlr")
 # print(stair_result)
 
-from ifc_tools.generated.attributes import extract_stair_riser_height
-riser_result = extract_stair_riser_height.extract_stair_riser_height(ifcfile_path, "38a9vdh9bF5Qg28GWyHhlr")
-print(riser_result)
+
+def main():
+    """Run the active manual check; importing this module has no side effects"""
+    from ifc_tools.generated.attributes import extract_stair_riser_height
+    riser_result = extract_stair_riser_height.extract_stair_riser_height(ifcfile_path, "38a9vdh9bF5Qg28GWyHhlr")
+    print(riser_result)
+
+
+if __name__ == "__main__":
+    main()
+
 
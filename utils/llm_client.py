@@ -1,4 +1,8 @@
 import openai
+import time
+import hashlib
+import threading
+from collections import OrderedDict
 from config import Config
 import instructor
 from typing import Optional, Type, TypeVar
@@ -8,7 +12,18 @@ T = TypeVar('T', bound=BaseModel)
 
 class LLMClient:
     """LLM client for interacting with OpenAI API with Instructor integration"""
-    
+
+    # Maximum number of plain-text responses kept in the shared response cache
+    MAX_CACHED_RESPONSES = 256
+
+    # Seconds a cached response stays valid
+    RESPONSE_CACHE_TTL = 3600
+
+    # LRU cache of prompt digest -> (monotonic timestamp, plain-text response), shared by all
+    # clients (calls use temperature=0); cleared per compliance session via clear_cache()
+    _response_cache = OrderedDict()
+    _response_cache_lock = threading.Lock()
+
     def __init__(self):
         """Initialize LLM client with both raw and instructor clients"""
         client_kwargs = {"api_key": Config.OPENAI_API_KEY}
@@ -50,6 +65,12 @@ class LLMClient:
                 print(f"Instructor API call failed: {e}")
                 return None  # Return None instead of error string
         else:
+            # Identical prompts to the same model reuse the earlier successful response
+            cache_key = self._cache_key(prompt, system_prompt)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
+
             # Use raw OpenAI client for plain text responses
             try:
                 for attempt in range(max_retries):
@@ -66,6 +87,7 @@ class LLMClient:
                         if content is None or content.strip() == "":
                             raise ValueError("Empty response from LLM")
 
+                        self._cache_response(cache_key, content)
                         return content
 
                     except Exception as e:
@@ -80,6 +102,41 @@ class LLMClient:
                 print(f"Plain text API call failed: {e}")
                 return f"API call failed: {e}"
 
+    def _cache_key(self, prompt: str, system_prompt: Optional[str]) -> bytes:
+        """Digest of model and messages, so cache keys stay small for long prompts"""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.model_name or "", system_prompt or "", prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.digest()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached plain-text responses"""
+        with cls._response_cache_lock:
+            cls._response_cache.clear()
+
+    def _get_cached_response(self, cache_key: bytes) -> Optional[str]:
+        """Return a cached response younger than RESPONSE_CACHE_TTL, or None on a miss"""
+        with self._response_cache_lock:
+            entry = self._response_cache.get(cache_key)
+            if entry is None:
+                return None
+            cached_at, content = entry
+            if time.monotonic() - cached_at > self.RESPONSE_CACHE_TTL:
+                del self._response_cache[cache_key]
+                return None
+            self._response_cache.move_to_end(cache_key)
+            return content
+
+    def _cache_response(self, cache_key: bytes, content: str) -> None:
+        """Store a successful plain-text response, evicting the least recently used one"""
+        with self._response_cache_lock:
+            self._response_cache[cache_key] = (time.monotonic(), content)
+            self._response_cache.move_to_end(cache_key)
+            if len(self._response_cache) > self.MAX_CACHED_RESPONSES:
+                self._response_cache.popitem(last=False)
+
     def generate_response_with_tools(self,
                                    prompt: str,
                                    system_prompt: str,